@@ -1,60 +1,65 @@
 import argparse
+import fnmatch
+import io
+import sys
+import threading
+import functools
+import mmap
 import os
 import json
 import glob
 import subprocess
 import shutil
-import struct
 import zipfile
 import urllib.request
-import getpass
 
-from chardet.universaldetector import UniversalDetector
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from types import MappingProxyType
 # Dependency check
 
-def check_dependencies():
-    if shutil.which('asar') is None:
-        print("Error: 'asar' binary not found. Please install it and add to your PATH.")
-        exit(1)
-    elif shutil.which('unrpa') is None:
-        print("Error: 'unrpa' binary not found. Please install it and add to your PATH.")
-        exit(1)
-    else:
-        if debug_mode:
-            print("'asar' and 'unrpa' binaries found.")
+@functools.lru_cache(maxsize=None)
+def require(bin_name):
+    path = shutil.which(bin_name)
+    if path is None:
+        print(f"Error: '{bin_name}' binary not found. Please install it and add to your PATH.")
+        sys.exit(1)
+    if debug_mode:
+        print(f"'{bin_name}' binary found at {path}.")
+    return path
 
 # Unity
+UNITY_EXTS = frozenset(('.assets', '.asset', '.bundle', '.unity3d', '.apk'))
+
+
 def setup_asset_ripper():
     choice = input('Using this type will require AssetRipper, which will be automatically downloaded.\nIs this okay? (y/n) : ')
     if choice.lower() == 'n':
         print("Exiting the script.")
         sys.exit(0)
-    elif user_input.lower() == 'y':
+    elif choice.lower() == 'y':
         print("Installing AssetRipper...")
         asset_ripper_url = "https://github.com/AssetRipper/AssetRipper/releases/download/0.3.4.0/AssetRipper_linux_x64.zip" # You may need to update the version in the future.
-        asset_ripper_zip_path = "AssetRipper_linux_x64.zip"
         asset_ripper_folder = "AssetRipper"
 
         if not os.path.exists(asset_ripper_folder):
-            sudo_password = getpass.getpass("Enter your sudo password to properly download AssetRipper: ")
             os.makedirs(asset_ripper_folder)
 
-            urllib.request.urlretrieve(asset_ripper_url, asset_ripper_zip_path)
+            with urllib.request.urlopen(asset_ripper_url) as response:
+                archive = io.BytesIO(response.read())
 
-            with zipfile.ZipFile(asset_ripper_zip_path, 'r') as zip_ref:
-                zip_ref.extractall(asset_ripper_folder)
+            with zipfile.ZipFile(archive) as outer_zip:
+                outer_zip.extractall(asset_ripper_folder)
 
-            os.remove(asset_ripper_zip_path)
-
-            for root, _, files in os.walk(asset_ripper_folder):
-                for file in files:
-                    if file.endswith('.zip'):
-                        inner_zip_path = os.path.join(root, file)
-                        with zipfile.ZipFile(inner_zip_path, 'r') as inner_zip_ref:
-                            inner_zip_ref.extractall(asset_ripper_folder)
-                        os.remove(inner_zip_path)
+                # The release zip nests a second zip; unpack it straight from
+                # the outer archive instead of re-reading it from disk.
+                for name in outer_zip.namelist():
+                    if name.endswith('.zip'):
+                        with outer_zip.open(name) as inner_file:
+                            with zipfile.ZipFile(io.BytesIO(inner_file.read())) as inner_zip:
+                                inner_zip.extractall(asset_ripper_folder)
+                        os.remove(os.path.join(asset_ripper_folder, name))
                         break
-            files_to_chmod = [
+            files_to_chmod = frozenset((
                 "AssetRipper",
                 "libcapstone.so",
                 "libHarfBuzzSharp.so",
@@ -62,16 +67,12 @@ def setup_asset_ripper():
                 "libTexture2DDecoderNative.so",
                 "libvlc.dylib",
                 "Licenses"
-            ]
-
-            for file_name in files_to_chmod:
-                file_path = os.path.join(asset_ripper_folder, file_name)
+            ))
 
-                if os.path.exists(file_path):
-                    chmod_command = f"echo {sudo_password} | sudo -S chmod +x {file_path}"
-                    subprocess.run(chmod_command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                else:
-                    print(f"File {file_name} does not exist, skipping chmod.")
+            with os.scandir(asset_ripper_folder) as it:
+                for entry in it:
+                    if entry.name in files_to_chmod:
+                        os.chmod(entry.path, 0o755)
     else:
         print("Invalid input. Exiting the script.")
         sys.exit(1)
@@ -82,67 +83,104 @@ def discover_unity_files(directory):
     if choice.lower() == 'n':
         print("Exiting the script.")
         sys.exit(0)
-    elif user_input.lower() == 'y':
+    elif choice.lower() == 'y':
         setup_asset_ripper()
-        for root, _, files in os.walk(directory):
-            for file in files:
-                if file.endswith(('.assets', '.asset', '.bundle', '.unity3d', '.apk')):
-                    print(f"Processing {file}")
-                    extract_all_assets(os.path.join(root, file))
-        merge_folders(directory, "Unity_combined")
+        found_files = []
+        for entry in scandir_walk(directory):
+            if os.path.splitext(entry.name)[1] in UNITY_EXTS:
+                found_files.append(entry.path)
+        extracted_folders = []
+        if found_files:
+            with ThreadPoolExecutor(max_workers=min(len(found_files), jobs)) as executor:
+                extracted_folders = list(executor.map(extract_all_assets, found_files))
+        merge_folders(directory, "Unity_combined", extracted_folders)
     else:
         print("Invalid input. Exiting the script.")
         sys.exit(1)
 
 
+# Guards the extracted-folder numbering when extractions run in parallel
+_extract_dir_lock = threading.Lock()
+
+
 def extract_all_assets(file_path):
+    print(f"Processing {os.path.basename(file_path)}")
     dir_name = os.path.dirname(file_path)
 
-    counter = 1
-    output_folder = os.path.join(dir_name, f"Unity_extracted_{counter}")
-    while os.path.exists(output_folder):
-        counter += 1
+    with _extract_dir_lock:
+        counter = 1
         output_folder = os.path.join(dir_name, f"Unity_extracted_{counter}")
+        while os.path.exists(output_folder):
+            counter += 1
+            output_folder = os.path.join(dir_name, f"Unity_extracted_{counter}")
 
-    os.makedirs(output_folder)
+        os.makedirs(output_folder)
 
     asset_ripper_command = ["./AssetRipper/AssetRipper", file_path, "-o", output_folder, '-q']
     subprocess.run(asset_ripper_command)
+    return output_folder
 
 
-def merge_folders(root_directory, combined_folder_name):
+def merge_folders(root_directory, combined_folder_name, extracted_folders=None):
     combined_folder_path = os.path.join(root_directory, combined_folder_name)
     if not os.path.exists(combined_folder_path):
         os.makedirs(combined_folder_path)
 
-    for root, _, files in os.walk(root_directory):
-        if 'Unity_extracted' in root:
-            for file in files:
-                source_file_path = os.path.join(root, file)
-                dest_file_path = os.path.join(combined_folder_path, file)
-
-                counter = 1
-                while os.path.exists(dest_file_path):
-                    name, ext = os.path.splitext(file)
-                    dest_file_path = os.path.join(combined_folder_path, f"{name}_{counter}{ext}")
-                    counter += 1
+    if extracted_folders is None:
+        # No list handed over (e.g. leftovers from an aborted run) - scan for
+        # them, keeping only the top-most matches: their subdirectories are
+        # merged and removed along with the parent.
+        extracted_folders = []
+        for root, dirs, _ in os.walk(root_directory):
+            if 'Unity_extracted' in root:
+                extracted_folders.append(root)
+                dirs.clear()
+
+    for folder in extracted_folders:
+        for entry in scandir_walk(folder):
+            file = entry.name
+            dest_file_path = os.path.join(combined_folder_path, file)
+
+            counter = 1
+            while os.path.exists(dest_file_path):
+                name, ext = os.path.splitext(file)
+                dest_file_path = os.path.join(combined_folder_path, f"{name}_{counter}{ext}")
+                counter += 1
 
-                shutil.copy2(source_file_path, dest_file_path)
-            
             try:
-                shutil.rmtree(root)
-            except Exception as e:
-                print(f"An error occurred while trying to remove the folder {root}: {e}")
+                os.rename(entry.path, dest_file_path)
+            except OSError:
+                # Cross-device move - fall back to copying the bytes
+                shutil.copyfile(entry.path, dest_file_path)
+
+        try:
+            shutil.rmtree(folder)
+        except Exception as e:
+            print(f"An error occurred while trying to remove the folder {folder}: {e}")
 
     print(f"Done! Files located at {root_directory}/Unity_combined")
 
 # RenPy
+RPA_PATTERN = '*.rpa'
+
+
 def discover_rpa(directory):
+    # Archives in the same directory share one out/ destination, so extract
+    # each directory's archives serially and only parallelize across
+    # directories; concurrent unrpa runs on one output tree race on mkdir
+    # and can interleave writes to identically named files.
+    rpa_groups = {}
     for root, dirs, files in os.walk(directory):
-        for file in files:
-            if file.endswith(".rpa"):
-                rpa_file_path = os.path.join(root, file)
-                extract_rpa_with_unrpa(rpa_file_path)
+        for file in fnmatch.filter(files, RPA_PATTERN):
+            rpa_groups.setdefault(root, []).append(os.path.join(root, file))
+
+    if rpa_groups:
+        with ThreadPoolExecutor(max_workers=min(len(rpa_groups), jobs)) as executor:
+            list(executor.map(extract_rpa_group, rpa_groups.values()))
+
+def extract_rpa_group(rpa_file_paths):
+    for rpa_file_path in rpa_file_paths:
+        extract_rpa_with_unrpa(rpa_file_path)
 
 def extract_rpa_with_unrpa(rpa_file_path):
     output_dir = os.path.join(os.path.dirname(rpa_file_path), 'out')
@@ -156,74 +194,92 @@ def extract_rpa_with_unrpa(rpa_file_path):
         return False
 
 # Electron based game
+ASAR_PATTERN = '*.asar'
+
 
 def discover_asar(directory):
     for root, dirs, files in os.walk(directory):
-        for file in files:
-            if file.endswith(".asar"):
-                extract_asar(root, file)
-                return True
+        for file in fnmatch.filter(files, ASAR_PATTERN):
+            # Only the first .asar is extracted; stop walking entirely.
+            dirs.clear()
+            extract_asar(root, file)
+            return True
 
 def extract_asar(root, file):
     file_path = os.path.join(root, file)
     output_path = os.path.join(root, 'out/')
-    command = f'asar extract {file_path} {output_path}'
+    command = ['asar', 'extract', file_path, output_path]
 
     if debug_mode:
         print(f"Executing command: {command}")
 
-    subprocess.run(command, shell=True, check=True)
+    subprocess.run(command, check=True, stdout=None if debug_mode else subprocess.DEVNULL)
     return True
 
+def scandir_walk(directory):
+    stack = [directory]
+    while stack:
+        current = stack.pop()
+        try:
+            it = os.scandir(current)
+        except OSError:
+            # Unreadable directory - skip it like os.walk's default onerror
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    yield entry
+
 # RPGMaker MV
+EXT_MAP = MappingProxyType({
+    '.rpgmvp': '.png',
+    '.png_': '.png',
+    '.rpgmvm': '.m4a',
+    '.m4a_': '.m4a',
+    '.rpgmvo': '.ogg',
+    '.ogg_': '.ogg'
+})
+DECRYPT_EXTS = frozenset(EXT_MAP)
+ENCRYPT_EXTS = frozenset(EXT_MAP.values())
+
+
 class Decrypter:
     default_header_len = 16
     default_signature = "5250474d56000000"
     default_version = "000301"
     default_remain = "0000000000"
     png_header_bytes = '89 50 4E 47 0D 0A 1A 0A 00 00 00 0D 49 48 44 52'
+
+    __slots__ = ('encrypt_code', '_key', '_key_int', '_header_len', '_fake_header',
+                 'ignore_fake_header', 'png_header_len')
+
     def __init__(self, encryption_key):
         # Encryption-Fields
         self.encrypt_code = encryption_key
-        self.encryption_code_array = self.split_encryption_code()
+        # Only the first header_len key bytes ever take part in the XOR, so
+        # truncate over-long keys here; _key_int would otherwise overflow the
+        # header-sized to_bytes in x_or_bytes.
+        self._key = bytes.fromhex(encryption_key)[:self.default_header_len] if encryption_key else b''
+        self._key_int = int.from_bytes(self._key, 'big')
 
         # Option Fields
         self.ignore_fake_header = False
 
-        # Fake-Header Info-Fields
-        self.header_len = None
-        self.signature = None
-        self.version = None
-        self.remain = None
-
         # Fake PNG-Header length
         self.png_header_len = None
 
-    def split_encryption_code(self):
-        if not self.encrypt_code:
-            return []
-
-        return [self.encrypt_code[i:i+2] for i in range(0, len(self.encrypt_code), 2)]
+        # Resolved once - these never change for the lifetime of a Decrypter
+        self._header_len = self.default_header_len
+        header_structure = self.default_signature + self.default_version + self.default_remain
+        self._fake_header = bytes.fromhex(header_structure)[:self._header_len]
 
     def verify_fake_header(self, file_header):
-        fake_header = self.build_fake_header()
-
-        for i in range(self.get_header_len()):
-            if file_header[i] != fake_header[i]:
-                return False
-
-        return True
+        return bytes(file_header[:self._header_len]) == self.build_fake_header()
 
     def build_fake_header(self):
-        header_len = self.get_header_len()
-        header_structure = self.get_signature() + self.get_version() + self.get_remain()
-
-        fake_header = bytearray(header_len)
-
-        for i in range(header_len):
-            fake_header[i] = int(header_structure[i * 2:i * 2 + 2], 16)
-
-        return fake_header
+        return self._fake_header
 
     def modify_file(self, rpg_file, mod_type, callback):
         with open(rpg_file.file, 'rb') as f:
@@ -247,83 +303,60 @@ class Decrypter:
         if not array_buffer:
             raise Exception("File is empty or can't be read.")
 
-        header_len = self.png_header_len if self.png_header_len is not None else self.get_header_len()
+        header_len = self.png_header_len if self.png_header_len is not None else self._header_len
         png_start_header = Decrypter.get_normal_png_header(header_len)
 
         header_len = len(png_start_header)
 
-        array_buffer = array_buffer[header_len * 2:]
+        return b''.join((png_start_header, memoryview(array_buffer)[header_len * 2:]))
 
-        tmp_int8_arr = bytearray(len(array_buffer) + header_len)
-        tmp_int8_arr[:header_len] = png_start_header
-        tmp_int8_arr[header_len:] = array_buffer
 
-        return tmp_int8_arr
-
-
-    def encrypt(self, array_buffer):
+    def encrypt_segments(self, array_buffer):
         if not array_buffer:
             raise Exception("File is empty or can't be read.")
 
-        array_buffer = self.x_or_bytes(array_buffer)
+        header_len = self._header_len
         fake_header = self.build_fake_header()
 
-        tmp_int8_array = bytearray(len(array_buffer) + self.get_header_len())
-        tmp_int8_array[:self.get_header_len()] = fake_header
-        tmp_int8_array[self.get_header_len():] = array_buffer
-
-        header = tmp_int8_array[:self.get_header_len()]
-        if not self.verify_fake_header(header):
+        if not self.verify_fake_header(fake_header):
             raise Exception("Fake-Header doesn't match the Template-Fake-Header... Please report this Bug")
 
-        return tmp_int8_array
+        return [
+            fake_header,
+            self.x_or_bytes(array_buffer[:header_len]),
+            memoryview(array_buffer)[header_len:],
+        ]
 
-    def decrypt(self, array_buffer):
+    def decrypt_segments(self, array_buffer):
         if not array_buffer:
             raise Exception("File is empty or can't be read.")
 
+        header_len = self._header_len
         if not self.ignore_fake_header:
-            header = array_buffer[:self.get_header_len()]
-            if not self.verify_fake_header(header):
+            if not self.verify_fake_header(array_buffer[:header_len]):
                 raise Exception("Fake-Header doesn't match the Template-Fake-Header.")
 
-        array_buffer = bytearray(array_buffer[self.get_header_len():])
-        array_buffer = self.x_or_bytes(array_buffer)
-
-        return array_buffer
-
-    def x_or_bytes(self, array_buffer):
-        header_len = self.get_header_len()
-
-        for i in range(header_len):
-            array_buffer[i] = array_buffer[i] ^ int(self.encryption_code_array[i], 16)
-
-        return array_buffer
-
-
-    def get_header_len(self):
-        if self.header_len is None or not isinstance(self.header_len, int):
-            self.header_len = self.default_header_len
-
-        return int(self.header_len)
+        return [
+            self.x_or_bytes(array_buffer[header_len:header_len * 2]),
+            memoryview(array_buffer)[header_len * 2:],
+        ]
 
-    def get_signature(self):
-        if self.signature is None:
-            self.signature = self.default_signature
-
-        return self.signature
+    def encrypt(self, array_buffer):
+        return b''.join(self.encrypt_segments(array_buffer))
 
-    def get_version(self):
-        if self.version is None:
-            self.version = self.default_version
+    def decrypt(self, array_buffer):
+        return b''.join(self.decrypt_segments(array_buffer))
 
-        return self.version
+    def x_or_bytes(self, file_header):
+        header_len = self._header_len
 
-    def get_remain(self):
-        if self.remain is None:
-            self.remain = self.default_remain
+        header = bytes(file_header[:header_len])
+        n = len(header)
+        prefix = int.from_bytes(header, 'big')
+        # Align the key for inputs shorter than header_len: XOR the n bytes
+        # we have against the first n key bytes instead of zero-padding.
+        return (prefix ^ (self._key_int >> 8 * (header_len - n))).to_bytes(n, 'big')
 
-        return self.remain
 
     def restore_header(self, rpg_file, callback):
         self.modify_file(rpg_file, 'restore', callback)
@@ -331,57 +364,102 @@ class Decrypter:
     def decrypt_file(self, rpg_file, callback):
         self.modify_file(rpg_file, 'decrypt', callback)
 
-    def process_directory(self, directory, operation):
+    @staticmethod
+    def valid_extensions(operation):
+        return DECRYPT_EXTS if operation == "decrypt" else ENCRYPT_EXTS
+
+    def process_directory(self, directory, operation, max_workers=None):
         if debug_mode:
             print(f"Processing directory: {directory} for operation: {operation}")
 
-        file_types = {
-            '.rpgmvp': '.png',
-            '.png_': '.png',
-            '.rpgmvm': '.m4a',
-            '.m4a_': '.m4a',
-            '.rpgmvo': '.ogg',
-            '.ogg_': '.ogg'
-        }
-
-        for root, dirs, files in os.walk(directory):
-            for file in files:
-                file_ext = os.path.splitext(file)[1]
-
-                if file_ext in file_types.keys() if operation == "decrypt" else file_types.values():
-                    orig_file_path = os.path.join(root, file)
-                    new_file_ext = file_types.get(file_ext, file_ext)
-                    new_file_name = os.path.splitext(file)[0] + new_file_ext
-                    new_file_path = os.path.join(root, new_file_name)
-                    if debug_mode:
-                        print(f"Processing file: {orig_file_path}")
-                        print(f"New file path will be: {new_file_path}")
-
-                    with open(orig_file_path, 'rb') as f:
-                        content = f.read()
-
-                    new_content = self.encrypt(content) if operation == "encrypt" else self.decrypt(content)
-
-                    with open(new_file_path, 'wb') as f:
-                        f.write(new_content)
-                    if debug_mode:
-                        print(f"Operation {operation} completed for file: {orig_file_path}")
-
-def find_system_json(directory):
-    if debug_mode:
-        print(f"Searching for System.json recursively in directory: {directory}")
-        print(f"Debug: Directory string type is {type(directory)} and value is {repr(directory)}")
-    for root, dirs, files in os.walk(directory):
-        if debug_mode:
-            print(f"Checking in directory: {root}")
-        if "System.json" in files:
-            full_path = os.path.join(root, "System.json")
+        valid_exts = self.valid_extensions(operation)
+        targets = [entry.path for entry in scandir_walk(directory)
+                   if os.path.splitext(entry.name)[1] in valid_exts]
+        self.process_files(targets, operation, max_workers)
+
+    def process_files(self, files, operation, max_workers=None):
+        get_new_ext = EXT_MAP.get
+        _splitext = os.path.splitext
+
+        pairs = []
+        for orig_file_path in files:
+            file_base, file_ext = _splitext(orig_file_path)
+            new_file_path = file_base + get_new_ext(file_ext, file_ext)
             if debug_mode:
-                print(f"Found System.json at: {full_path}")
-            return full_path
+                print(f"Processing file: {orig_file_path}")
+                print(f"New file path will be: {new_file_path}")
+            pairs.append((orig_file_path, new_file_path))
+
+        worker = functools.partial(_process_one, operation=operation, key=self.encrypt_code)
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            list(executor.map(worker, pairs, chunksize=32))
+
+        if debug_mode:
+            print(f"Operation {operation} completed for {len(pairs)} files")
+
+def _writev_all(fd, segments):
+    # os.writev may write less than the full iovec (at most ~2 GiB per call
+    # on Linux); keep submitting until every segment is consumed.
+    pending = [memoryview(segment) for segment in segments]
+    # Drop the caller's list from this frame: on error the traceback keeps
+    # the frame alive, and any surviving reference to the source views would
+    # block the caller from closing its mmap.
+    del segments
+    try:
+        while pending:
+            written = os.writev(fd, pending)
+            while pending and written >= len(pending[0]):
+                written -= len(pending[0])
+                pending.pop(0)
+            if pending and written:
+                pending[0] = pending[0][written:]
+    finally:
+        # Drop our views even when writev fails: the traceback keeps this
+        # frame alive, and lingering exports would turn the caller's mmap
+        # close into a BufferError that masks the real disk error.
+        for view in pending:
+            view.release()
+        pending.clear()
+
+
+def _process_one(path_pair, operation, key):
+    orig_file_path, new_file_path = path_pair
+    decrypter = Decrypter(key)
+
+    tmp_file_path = new_file_path + '.tmp'
+    try:
+        with open(orig_file_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                segments = decrypter.encrypt_segments(mm) if operation == "encrypt" else decrypter.decrypt_segments(mm)
+
+                out_fd = os.open(tmp_file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    _writev_all(out_fd, segments)
+                finally:
+                    os.close(out_fd)
+                    # release the exported views so the mmap can close
+                    del segments
+        os.replace(tmp_file_path, new_file_path)
+    except BaseException:
+        if os.path.exists(tmp_file_path):
+            os.remove(tmp_file_path)
+        raise
+
+
+def scan_tree(directory, exts):
+    """Single traversal that finds System.json and collects matching assets."""
     if debug_mode:
-        print("System.json not found.")
-    return None
+        print(f"Scanning directory: {directory}")
+    system_json = None
+    targets = []
+    for entry in scandir_walk(directory):
+        if system_json is None and entry.name == "System.json":
+            system_json = entry.path
+            if debug_mode:
+                print(f"Found System.json at: {system_json}")
+        elif os.path.splitext(entry.name)[1] in exts:
+            targets.append(entry.path)
+    return system_json, targets
 
 
 def read_system_json(file_path):
@@ -395,6 +473,7 @@ def parse_args():
     parser.add_argument('-o', '--operation', type=str, choices=['encrypt', 'decrypt'], required=True, help='Operation to perform: encrypt or decrypt.')
     parser.add_argument('--debug', help='Enable debug output.', action='store_true')
     parser.add_argument('--type', help='Specify the type of RPG Maker or other.', required=True, choices=['rpgmakermv', 'electron', 'renpy', 'unity'])
+    parser.add_argument('--jobs', type=int, default=os.cpu_count(), help='Number of parallel extraction jobs.')
     return parser.parse_args()
 
 
@@ -404,14 +483,13 @@ if __name__ == "__main__":
     operation = args.operation
     debug_mode = args.debug
     decrypter_type = args.type
-
-    check_dependencies()
+    jobs = args.jobs
 
     if debug_mode:
         print(f"Arguments parsed. Directory: {directory}, Operation: {operation}, Type: {decrypter_type}")
 
     if decrypter_type == 'rpgmakermv':
-        system_json_path = find_system_json(directory)
+        system_json_path, targets = scan_tree(directory, Decrypter.valid_extensions(operation))
         if system_json_path:
             if debug_mode:
                 print(f"Found System.json at: {system_json_path}")
@@ -422,7 +500,7 @@ if __name__ == "__main__":
                 if debug_mode:
                     print(f"Encryption key found: {encryption_key}")
                 decrypter = Decrypter(encryption_key)
-                decrypter.process_directory(directory, operation)
+                decrypter.process_files(targets, operation, max_workers=jobs)
             else:
                 if debug_mode:
                     print("No encryption key found in System.json. Exiting.")
@@ -430,8 +508,10 @@ if __name__ == "__main__":
             if debug_mode:
                 print("System.json not found. Exiting.")
     elif decrypter_type == 'electron':
+        require('asar')
         discover_asar(directory)
     elif decrypter_type == 'renpy':
+        require('unrpa')
         discover_rpa(directory)
     elif decrypter_type == 'unity':
         discover_unity_files(directory)